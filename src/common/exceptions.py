@@ -9,10 +9,17 @@
 class GenericException(Exception):
     """A generic exception, which is used as the base of all other exception."""
 
+    __slots__ = ("code",)
+
     def __init__(self, msg, *args, code=-1):
         super().__init__(msg, *args)
         self.code = code
 
+    def __reduce__(self):
+        # A slot is not part of the default exception state, so the code is added explicitly to
+        # be kept when an exception is pickled or copied.
+        return self.__class__, self.args, {**getattr(self, "__dict__", {}), "code": self.code}
+
 
 class InvalidSchema(GenericException):
     """
@@ -21,7 +28,7 @@ class InvalidSchema(GenericException):
     """
 
     def __init__(self, msg, *args, code=-1):
-        super().__init__(msg.split("\n")[-1], *args, code=code)
+        super().__init__(msg.rpartition("\n")[2], *args, code=code)
 
 
 # noinspection DuplicatedCode
@@ -3,12 +3,16 @@
 #  This is proprietary source code of DataRobot, Inc. and its affiliates.
 #  Released under the terms of DataRobot Tool and Utility Agreement.
 
+# pylint: disable=too-many-lines
+
 """
 A module that contains schema validators for model and deployment definitions.
 """
 
+import copy
 import logging
 
+import fastjsonschema
 from bson import ObjectId
 from schema import And
 from schema import Optional
@@ -19,13 +23,55 @@ from schema import Use
 
 from common.convertors import MemoryConvertor
 from common.exceptions import EmptyKey
+from common.exceptions import InvalidMemoryValue
 from common.exceptions import InvalidModelSchema
 from common.exceptions import InvalidSchema
+from common.exceptions import NamespaceNotInitialized
 from common.exceptions import UnexpectedType
 from common.namepsace import Namespace
 
 logger = logging.getLogger()
 
+# In draft-04, unlike later drafts, an integer must be an actual int and not a float (e.g. 2.0)
+_JSON_SCHEMA_DRAFT = "http://json-schema.org/draft-04/schema#"
+_FORMATS = {"object-id": ObjectId.is_valid}
+_NON_EMPTY_STRING = {"type": "string", "minLength": 1}
+_OBJECT_ID = {"type": "string", "format": "object-id"}
+_MEMORY = {"type": ["string", "integer"]}
+_BOOLEAN = {"type": "boolean"}
+
+
+def _root_schema(schema):
+    """A JSON schema of a whole document, which is validated by the draft-04 rules."""
+
+    return {"$schema": _JSON_SCHEMA_DRAFT, **schema}
+
+
+def _strict_object(properties, required=None):
+    """A JSON schema of an object that only accepts the given properties."""
+
+    return {
+        "type": "object",
+        "properties": properties,
+        "required": required or [],
+        "additionalProperties": False,
+    }
+
+
+def _int_range(minimum, maximum=None):
+    """A JSON schema of an integer in a given range."""
+
+    int_range = {"type": "integer", "minimum": minimum}
+    if maximum is not None:
+        int_range["maximum"] = maximum
+    return int_range
+
+
+def _number_range(minimum, maximum):
+    """A JSON schema of a number in a given range."""
+
+    return {"type": "number", "minimum": minimum, "maximum": maximum}
+
 
 class SharedSchema:
     """
@@ -37,30 +83,69 @@ class SharedSchema:
     SETTINGS_SECTION_KEY = "settings"
 
     @classmethod
-    def _validate_and_transform_single(cls, schema, metadata):
+    def _validate(cls, schema, metadata):
+        """
+        Validates a metadata against a given schema. Derived classes may override it in order to
+        use a different schema implementation.
+
+        Parameters
+        ----------
+        schema : Schema
+            The schema to validate against.
+        metadata : dict or list
+            A single or multi metadata definition.
+
+        Returns
+        -------
+        dict or list,
+            The validated and transformed metadata.
+        """
+
         try:
-            transformed = schema.validate(metadata)
-            cls._validate_single_transformed(transformed)
-            return transformed
+            return schema.validate(metadata)
         except SchemaError as ex:
             raise InvalidSchema(ex.code) from ex
 
+    @classmethod
+    def _validate_and_transform_single(cls, schema, metadata):
+        transformed = cls._validate(schema, metadata)
+        cls._validate_single_transformed(transformed)
+        return transformed
+
     @classmethod
     def _validate_single_transformed(cls, single_transformed_metadata):
         cls._validate_mutual_exclusive_keys(single_transformed_metadata)
         cls._validate_dependent_keys(single_transformed_metadata)
         cls._validate_data_integrity(single_transformed_metadata)
 
+    @classmethod
+    def _validate_multi(cls, schema, multi_metadata):
+        """
+        Validates a multi metadata definition against a given schema. By default, it is validated
+        the same way as a single metadata. Derived classes may override it in order to validate
+        the metadata entries separately.
+
+        Parameters
+        ----------
+        schema : Schema
+            The schema to validate against.
+        multi_metadata : dict or list
+            A multi metadata definition.
+
+        Returns
+        -------
+        dict or list,
+            The validated and transformed metadata.
+        """
+
+        return cls._validate(schema, multi_metadata)
+
     @classmethod
     def _validate_and_transform_multi(cls, schema, multi_metadata):
-        # Validates and transform
-        try:
-            transformed = schema.validate(multi_metadata)
-            for single_metadata in cls._next_single_transformed(transformed):
-                cls._validate_single_transformed(single_metadata)
-            return transformed
-        except SchemaError as ex:
-            raise InvalidSchema(ex.code) from ex
+        transformed = cls._validate_multi(schema, multi_metadata)
+        for single_metadata in cls._next_single_transformed(transformed):
+            cls._validate_single_transformed(single_metadata)
+        return transformed
 
     @classmethod
     def _next_single_transformed(cls, multi_transformed):
@@ -216,6 +301,16 @@ class ModelSchema(SharedSchema):
     TARGET_TYPE_UNSTRUCTURED_MULTICLASS = "Unstructured (Multiclass)"
     TARGET_TYPE_UNSTRUCTURED_OTHER = "Unstructured (Other)"
 
+    BINARY_TARGET_TYPES = (TARGET_TYPE_BINARY, TARGET_TYPE_UNSTRUCTURED_BINARY)
+    REGRESSION_TARGET_TYPES = (TARGET_TYPE_REGRESSION, TARGET_TYPE_UNSTRUCTURED_REGRESSION)
+    MULTICLASS_TARGET_TYPES = (TARGET_TYPE_MULTICLASS, TARGET_TYPE_UNSTRUCTURED_MULTICLASS)
+    UNSTRUCTURED_TARGET_TYPES = (
+        TARGET_TYPE_UNSTRUCTURED_REGRESSION,
+        TARGET_TYPE_UNSTRUCTURED_BINARY,
+        TARGET_TYPE_UNSTRUCTURED_MULTICLASS,
+        TARGET_TYPE_UNSTRUCTURED_OTHER,
+    )
+
     TARGET_NAME_KEY = "target_name"
 
     # Regression models
@@ -282,108 +377,174 @@ class ModelSchema(SharedSchema):
     MINIMUM_PAYLOAD_SIZE_KEY = "minimum_payload_size"
     MAXIMUM_PAYLOAD_SIZE_KEY = "maximum_payload_size"
 
-    MODEL_SCHEMA = Schema(
-        {
-            SharedSchema.MODEL_ID_KEY: And(str, len, Use(Namespace.namespaced)),
-            TARGET_TYPE_KEY: Or(
-                TARGET_TYPE_BINARY,
-                TARGET_TYPE_REGRESSION,
-                TARGET_TYPE_MULTICLASS,
-                TARGET_TYPE_ANOMALY_DETECTION,
-                TARGET_TYPE_TEXT_GENERATION,
-                TARGET_TYPE_UNSTRUCTURED_BINARY,
-                TARGET_TYPE_UNSTRUCTURED_REGRESSION,
-                TARGET_TYPE_UNSTRUCTURED_MULTICLASS,
-                TARGET_TYPE_UNSTRUCTURED_OTHER,
-            ),
-            SharedSchema.SETTINGS_SECTION_KEY: {
-                NAME_KEY: And(str, len),
-                Optional(DESCRIPTION_KEY): And(str, len),
-                Optional(LANGUAGE_KEY): And(str, len),
-                TARGET_NAME_KEY: And(str, len),
-                Optional(PREDICTION_THRESHOLD_KEY): And(float, lambda n: 0 <= n <= 1),
-                Optional(POSITIVE_CLASS_LABEL_KEY): And(str, len),
-                Optional(NEGATIVE_CLASS_LABEL_KEY): And(str, len),
-                Optional(CLASS_LABELS_KEY): list,
-                Optional(PARTITIONING_COLUMN_KEY): And(str, len),
-                Optional(TRAINING_DATASET_ID_KEY): And(str, ObjectId.is_valid),
-                Optional(HOLDOUT_DATASET_ID_KEY): And(str, ObjectId.is_valid),
-            },
-            VERSION_KEY: {
-                MODEL_ENV_ID_KEY: And(str, ObjectId.is_valid),
-                Optional(INCLUDE_GLOB_KEY, default=[]): And(
-                    list, lambda l: all(isinstance(e, str) and len(e) > 0 for e in l)
-                ),
-                Optional(EXCLUDE_GLOB_KEY, default=[]): And(
-                    list, lambda l: all(isinstance(x, str) and len(x) > 0 for x in l)
+    MODEL_SCHEMA = _root_schema(
+        _strict_object(
+            {
+                SharedSchema.MODEL_ID_KEY: _NON_EMPTY_STRING,
+                TARGET_TYPE_KEY: {
+                    "enum": [
+                        TARGET_TYPE_BINARY,
+                        TARGET_TYPE_REGRESSION,
+                        TARGET_TYPE_MULTICLASS,
+                        TARGET_TYPE_ANOMALY_DETECTION,
+                        TARGET_TYPE_TEXT_GENERATION,
+                        TARGET_TYPE_UNSTRUCTURED_BINARY,
+                        TARGET_TYPE_UNSTRUCTURED_REGRESSION,
+                        TARGET_TYPE_UNSTRUCTURED_MULTICLASS,
+                        TARGET_TYPE_UNSTRUCTURED_OTHER,
+                    ]
+                },
+                SharedSchema.SETTINGS_SECTION_KEY: _strict_object(
+                    {
+                        NAME_KEY: _NON_EMPTY_STRING,
+                        DESCRIPTION_KEY: _NON_EMPTY_STRING,
+                        LANGUAGE_KEY: _NON_EMPTY_STRING,
+                        TARGET_NAME_KEY: _NON_EMPTY_STRING,
+                        PREDICTION_THRESHOLD_KEY: _number_range(0, 1),
+                        POSITIVE_CLASS_LABEL_KEY: _NON_EMPTY_STRING,
+                        NEGATIVE_CLASS_LABEL_KEY: _NON_EMPTY_STRING,
+                        CLASS_LABELS_KEY: {"type": "array"},
+                        PARTITIONING_COLUMN_KEY: _NON_EMPTY_STRING,
+                        TRAINING_DATASET_ID_KEY: _OBJECT_ID,
+                        HOLDOUT_DATASET_ID_KEY: _OBJECT_ID,
+                    },
+                    required=[NAME_KEY, TARGET_NAME_KEY],
                 ),
-                Optional(MEMORY_KEY): Use(MemoryConvertor.to_bytes),
-                Optional(REPLICAS_KEY): And(int, lambda r: r > 0),
-                Optional(EGRESS_NETWORK_POLICY_KEY): Or(
-                    EGRESS_NETWORK_POLICY_NONE, EGRESS_NETWORK_POLICY_PUBLIC
+                VERSION_KEY: _strict_object(
+                    {
+                        MODEL_ENV_ID_KEY: _OBJECT_ID,
+                        INCLUDE_GLOB_KEY: {
+                            "type": "array",
+                            "items": _NON_EMPTY_STRING,
+                            "default": [],
+                        },
+                        EXCLUDE_GLOB_KEY: {
+                            "type": "array",
+                            "items": _NON_EMPTY_STRING,
+                            "default": [],
+                        },
+                        MEMORY_KEY: _MEMORY,
+                        REPLICAS_KEY: _int_range(1),
+                        EGRESS_NETWORK_POLICY_KEY: {
+                            "enum": [EGRESS_NETWORK_POLICY_NONE, EGRESS_NETWORK_POLICY_PUBLIC]
+                        },
+                        PARTITIONING_COLUMN_KEY: _NON_EMPTY_STRING,
+                        TRAINING_DATASET_ID_KEY: _OBJECT_ID,
+                        HOLDOUT_DATASET_ID_KEY: _OBJECT_ID,
+                        MODEL_REPLACEMENT_REASON_KEY: {
+                            "enum": [
+                                MODEL_REPLACEMENT_REASON_ACCURACY,
+                                MODEL_REPLACEMENT_REASON_DATA_DRIFT,
+                                MODEL_REPLACEMENT_REASON_ERRORS,
+                                MODEL_REPLACEMENT_REASON_SCHEDULED_REFRESH,
+                                MODEL_REPLACEMENT_REASON_SCORING_SPEED,
+                                MODEL_REPLACEMENT_REASON_DEPRECATION,
+                                MODEL_REPLACEMENT_REASON_OTHER,
+                            ],
+                            "default": MODEL_REPLACEMENT_REASON_OTHER,
+                        },
+                    },
+                    required=[MODEL_ENV_ID_KEY],
                 ),
-                Optional(PARTITIONING_COLUMN_KEY): And(str, len),
-                Optional(TRAINING_DATASET_ID_KEY): And(str, ObjectId.is_valid),
-                Optional(HOLDOUT_DATASET_ID_KEY): And(str, ObjectId.is_valid),
-                Optional(MODEL_REPLACEMENT_REASON_KEY, default=MODEL_REPLACEMENT_REASON_OTHER): Or(
-                    MODEL_REPLACEMENT_REASON_ACCURACY,
-                    MODEL_REPLACEMENT_REASON_DATA_DRIFT,
-                    MODEL_REPLACEMENT_REASON_ERRORS,
-                    MODEL_REPLACEMENT_REASON_SCHEDULED_REFRESH,
-                    MODEL_REPLACEMENT_REASON_SCORING_SPEED,
-                    MODEL_REPLACEMENT_REASON_DEPRECATION,
-                    MODEL_REPLACEMENT_REASON_OTHER,
+                TEST_KEY: _strict_object(
+                    {
+                        # The skip attribute allows users to have the test section in their yaml
+                        # file and still disable testing
+                        TEST_SKIP_KEY: {"type": "boolean", "default": False},
+                        TEST_DATA_ID_KEY: _OBJECT_ID,
+                        MEMORY_KEY: _MEMORY,
+                        CHECKS_KEY: _strict_object(
+                            {
+                                NULL_VALUE_IMPUTATION_KEY: _strict_object(
+                                    {
+                                        CHECK_ENABLED_KEY: _BOOLEAN,
+                                        BLOCK_DEPLOYMENT_IF_FAILS_KEY: _BOOLEAN,
+                                    },
+                                    required=[CHECK_ENABLED_KEY, BLOCK_DEPLOYMENT_IF_FAILS_KEY],
+                                ),
+                                SIDE_EFFECTS_KEY: _strict_object(
+                                    {
+                                        CHECK_ENABLED_KEY: _BOOLEAN,
+                                        BLOCK_DEPLOYMENT_IF_FAILS_KEY: _BOOLEAN,
+                                    },
+                                    required=[CHECK_ENABLED_KEY, BLOCK_DEPLOYMENT_IF_FAILS_KEY],
+                                ),
+                                PREDICTION_VERIFICATION_KEY: _strict_object(
+                                    {
+                                        CHECK_ENABLED_KEY: _BOOLEAN,
+                                        BLOCK_DEPLOYMENT_IF_FAILS_KEY: _BOOLEAN,
+                                        OUTPUT_DATASET_ID_KEY: _OBJECT_ID,
+                                        PREDICTIONS_COLUMN: _NON_EMPTY_STRING,
+                                        MATCH_THRESHOLD_KEY: _number_range(0, 1),
+                                        PASSING_MATCH_RATE_KEY: _int_range(0, 100),
+                                    },
+                                    required=[
+                                        CHECK_ENABLED_KEY,
+                                        BLOCK_DEPLOYMENT_IF_FAILS_KEY,
+                                        OUTPUT_DATASET_ID_KEY,
+                                        PREDICTIONS_COLUMN,
+                                    ],
+                                ),
+                                PERFORMANCE_KEY: _strict_object(
+                                    {
+                                        CHECK_ENABLED_KEY: _BOOLEAN,
+                                        BLOCK_DEPLOYMENT_IF_FAILS_KEY: _BOOLEAN,
+                                        MAXIMUM_RESPONSE_TIME_KEY: _int_range(1, 1800),
+                                        MAXIMUM_EXECUTION_TIME: _int_range(1, 1800),
+                                        NUMBER_OF_PARALLEL_USERS_KEY: _int_range(1, 4),
+                                    },
+                                    required=[CHECK_ENABLED_KEY, BLOCK_DEPLOYMENT_IF_FAILS_KEY],
+                                ),
+                                STABILITY_KEY: _strict_object(
+                                    {
+                                        CHECK_ENABLED_KEY: _BOOLEAN,
+                                        BLOCK_DEPLOYMENT_IF_FAILS_KEY: _BOOLEAN,
+                                        TOTAL_PREDICTION_REQUESTS_KEY: _int_range(1),
+                                        PASSING_RATE_KEY: _int_range(0, 100),
+                                        NUMBER_OF_PARALLEL_USERS_KEY: _int_range(1, 4),
+                                        MINIMUM_PAYLOAD_SIZE_KEY: _int_range(1),
+                                        MAXIMUM_PAYLOAD_SIZE_KEY: _int_range(1),
+                                    },
+                                    required=[CHECK_ENABLED_KEY, BLOCK_DEPLOYMENT_IF_FAILS_KEY],
+                                ),
+                            }
+                        ),
+                    }
                 ),
             },
-            Optional(TEST_KEY): {
-                # The skip attribute allows users to have the test section in their yaml file
-                # and still disable testing
-                Optional(TEST_SKIP_KEY, default=False): bool,
-                Optional(TEST_DATA_ID_KEY): And(str, ObjectId.is_valid),
-                Optional(MEMORY_KEY): Use(MemoryConvertor.to_bytes),
-                Optional(CHECKS_KEY): {
-                    Optional(NULL_VALUE_IMPUTATION_KEY): {
-                        CHECK_ENABLED_KEY: bool,
-                        BLOCK_DEPLOYMENT_IF_FAILS_KEY: bool,
-                    },
-                    Optional(SIDE_EFFECTS_KEY): {
-                        CHECK_ENABLED_KEY: bool,
-                        BLOCK_DEPLOYMENT_IF_FAILS_KEY: bool,
-                    },
-                    Optional(PREDICTION_VERIFICATION_KEY): {
-                        CHECK_ENABLED_KEY: bool,
-                        BLOCK_DEPLOYMENT_IF_FAILS_KEY: bool,
-                        OUTPUT_DATASET_ID_KEY: And(str, ObjectId.is_valid),
-                        PREDICTIONS_COLUMN: And(str, len),
-                        Optional(MATCH_THRESHOLD_KEY): And(float, lambda v: 0 <= v <= 1),
-                        Optional(PASSING_MATCH_RATE_KEY): And(int, lambda v: 0 <= v <= 100),
-                    },
-                    Optional(PERFORMANCE_KEY): {
-                        CHECK_ENABLED_KEY: bool,
-                        BLOCK_DEPLOYMENT_IF_FAILS_KEY: bool,
-                        Optional(MAXIMUM_RESPONSE_TIME_KEY): And(int, lambda v: 1 <= v <= 1800),
-                        Optional(MAXIMUM_EXECUTION_TIME): And(int, lambda v: 1 <= v <= 1800),
-                        Optional(NUMBER_OF_PARALLEL_USERS_KEY): And(int, lambda v: 1 <= v <= 4),
-                    },
-                    Optional(STABILITY_KEY): {
-                        CHECK_ENABLED_KEY: bool,
-                        BLOCK_DEPLOYMENT_IF_FAILS_KEY: bool,
-                        Optional(TOTAL_PREDICTION_REQUESTS_KEY): And(int, lambda v: v >= 1),
-                        Optional(PASSING_RATE_KEY): And(int, lambda v: 0 <= v <= 100),
-                        Optional(NUMBER_OF_PARALLEL_USERS_KEY): And(int, lambda v: 1 <= v <= 4),
-                        Optional(MINIMUM_PAYLOAD_SIZE_KEY): And(int, lambda v: v >= 1),
-                        Optional(MAXIMUM_PAYLOAD_SIZE_KEY): And(int, lambda v: v >= 1),
-                    },
-                },
+            required=[
+                SharedSchema.MODEL_ID_KEY,
+                TARGET_TYPE_KEY,
+                SharedSchema.SETTINGS_SECTION_KEY,
+                VERSION_KEY,
+            ],
+        )
+    )
+    # Every model metadata entry under the 'MULTI_MODELS_KEY' section is validated against the
+    # 'MODEL_SCHEMA' by the single model validator, so only the entries' structure is defined here.
+    MULTI_MODELS_SCHEMA = _root_schema(
+        _strict_object(
+            {
+                MULTI_MODELS_KEY: {
+                    "type": "array",
+                    "items": _strict_object(
+                        {
+                            MODEL_ENTRY_PATH_KEY: _NON_EMPTY_STRING,
+                            MODEL_ENTRY_META_KEY: {"type": "object"},
+                        },
+                        required=[MODEL_ENTRY_PATH_KEY, MODEL_ENTRY_META_KEY],
+                    ),
+                }
             },
-        }
+            required=[MULTI_MODELS_KEY],
+        )
     )
-    MULTI_MODELS_SCHEMA = Schema(
-        {
-            MULTI_MODELS_KEY: [
-                {MODEL_ENTRY_PATH_KEY: And(str, len), MODEL_ENTRY_META_KEY: MODEL_SCHEMA.schema}
-            ]
-        }
+
+    # The schemas are compiled once, when the class is defined, and the generated validators are
+    # reused for every model definition. The validators also fill in the schemas' default values.
+    _COMPILED_SINGLE = fastjsonschema.compile(MODEL_SCHEMA, formats=_FORMATS, use_default=True)
+    _COMPILED_MULTI = fastjsonschema.compile(
+        MULTI_MODELS_SCHEMA, formats=_FORMATS, use_default=True
     )
 
     @classmethod
@@ -405,7 +566,7 @@ class ModelSchema(SharedSchema):
         return (
             isinstance(metadata, dict)
             and cls.MODEL_ID_KEY in metadata
-            and not DeploymentSchema.is_single_deployment_schema(metadata)
+            and DeploymentSchema.DEPLOYMENT_ID_KEY not in metadata
         )
 
     @classmethod
@@ -424,7 +585,7 @@ class ModelSchema(SharedSchema):
             Whether the given metadata is suspected to be a multi-model metadata
         """
 
-        return cls.MULTI_MODELS_KEY in metadata
+        return isinstance(metadata, dict) and cls.MULTI_MODELS_KEY in metadata
 
     @classmethod
     def is_binary(cls, metadata):
@@ -442,10 +603,7 @@ class ModelSchema(SharedSchema):
             Whether the model's target type is Binary.
         """
 
-        return metadata[ModelSchema.TARGET_TYPE_KEY] in [
-            cls.TARGET_TYPE_BINARY,
-            cls.TARGET_TYPE_UNSTRUCTURED_BINARY,
-        ]
+        return metadata[ModelSchema.TARGET_TYPE_KEY] in cls.BINARY_TARGET_TYPES
 
     @classmethod
     def is_regression(cls, metadata):
@@ -463,10 +621,7 @@ class ModelSchema(SharedSchema):
             Whether the model's target type is Regression.
         """
 
-        return metadata[ModelSchema.TARGET_TYPE_KEY] in [
-            cls.TARGET_TYPE_REGRESSION,
-            cls.TARGET_TYPE_UNSTRUCTURED_REGRESSION,
-        ]
+        return metadata[ModelSchema.TARGET_TYPE_KEY] in cls.REGRESSION_TARGET_TYPES
 
     @classmethod
     def is_multiclass(cls, metadata):
@@ -484,10 +639,7 @@ class ModelSchema(SharedSchema):
             Whether the model's target type is MultiClass.
         """
 
-        return metadata[ModelSchema.TARGET_TYPE_KEY] in [
-            cls.TARGET_TYPE_MULTICLASS,
-            cls.TARGET_TYPE_UNSTRUCTURED_MULTICLASS,
-        ]
+        return metadata[ModelSchema.TARGET_TYPE_KEY] in cls.MULTICLASS_TARGET_TYPES
 
     @classmethod
     def is_unstructured(cls, metadata):
@@ -505,12 +657,7 @@ class ModelSchema(SharedSchema):
             Whether the model's target is unstructured.
         """
 
-        return metadata[ModelSchema.TARGET_TYPE_KEY] in [
-            ModelSchema.TARGET_TYPE_UNSTRUCTURED_REGRESSION,
-            ModelSchema.TARGET_TYPE_UNSTRUCTURED_BINARY,
-            ModelSchema.TARGET_TYPE_UNSTRUCTURED_MULTICLASS,
-            ModelSchema.TARGET_TYPE_UNSTRUCTURED_OTHER,
-        ]
+        return metadata[ModelSchema.TARGET_TYPE_KEY] in cls.UNSTRUCTURED_TARGET_TYPES
 
     @classmethod
     def validate_and_transform_single(cls, model_metadata):
@@ -529,7 +676,7 @@ class ModelSchema(SharedSchema):
             A single model metadata.
         """
 
-        model_metadata = cls._validate_and_transform_single(cls.MODEL_SCHEMA, model_metadata)
+        model_metadata = cls._validate_and_transform_single(cls._COMPILED_SINGLE, model_metadata)
         logger.debug("Model configuration is valid (id: %s).", model_metadata[cls.MODEL_ID_KEY])
         return model_metadata
 
@@ -551,11 +698,67 @@ class ModelSchema(SharedSchema):
         """
 
         multi_model_metadata = cls._validate_and_transform_multi(
-            cls.MULTI_MODELS_SCHEMA, multi_models_metadata
+            cls._COMPILED_MULTI, multi_models_metadata
         )
         logger.debug("Multi models configuration is valid.")
         return multi_model_metadata
 
+    @classmethod
+    def _validate(cls, schema, metadata):
+        # The compiled validator injects default values in-place, so it is applied on a copy to
+        # keep the input metadata untouched.
+        transformed = copy.deepcopy(metadata)
+        try:
+            schema(transformed)
+        except fastjsonschema.JsonSchemaValueException as ex:
+            raise InvalidModelSchema(cls._schema_error_message(ex)) from ex
+        cls._transform_single(transformed)
+        return transformed
+
+    @classmethod
+    def _validate_multi(cls, schema, multi_metadata):
+        transformed = copy.deepcopy(multi_metadata)
+        try:
+            schema(transformed)
+            for index, single_transformed in enumerate(cls._next_single_transformed(transformed)):
+                cls._COMPILED_SINGLE(
+                    single_transformed,
+                    name_prefix=f"data.{cls.MULTI_MODELS_KEY}[{index}].{cls.MODEL_ENTRY_META_KEY}",
+                )
+        except fastjsonschema.JsonSchemaValueException as ex:
+            raise InvalidModelSchema(cls._schema_error_message(ex)) from ex
+        for single_transformed in cls._next_single_transformed(transformed):
+            cls._transform_single(single_transformed)
+        return transformed
+
+    @staticmethod
+    def _schema_error_message(ex):
+        # Missing and unexpected keys are reported in the same form as the 'schema' package does.
+        if ex.rule == "required":
+            missing_keys = sorted(
+                (k for k in ex.definition["required"] if k not in ex.value), key=repr
+            )
+            plural = "s" if len(missing_keys) > 1 else ""
+            return f"Missing key{plural}: {', '.join(repr(k) for k in missing_keys)}"
+        if ex.rule == "additionalProperties":
+            wrong_keys = [k for k in ex.value if k not in ex.definition["properties"]]
+            plural = "s" if len(wrong_keys) > 1 else ""
+            return f"Wrong key{plural} {', '.join(repr(k) for k in wrong_keys)} in {ex.value!r}"
+        return ex.message
+
+    @classmethod
+    def _transform_single(cls, single_model_metadata):
+        try:
+            single_model_metadata[cls.MODEL_ID_KEY] = Namespace.namespaced(
+                single_model_metadata[cls.MODEL_ID_KEY]
+            )
+            for section_key in [cls.VERSION_KEY, cls.TEST_KEY]:
+                section = single_model_metadata.get(section_key)
+                if section and cls.MEMORY_KEY in section:
+                    section[cls.MEMORY_KEY] = MemoryConvertor.to_bytes(section[cls.MEMORY_KEY])
+        except (NamespaceNotInitialized, InvalidMemoryValue) as ex:
+            raise InvalidModelSchema(str(ex)) from ex
+
     @classmethod
     def _next_single_transformed(cls, multi_transformed):
         for model_entry in multi_transformed[cls.MULTI_MODELS_KEY]:
@@ -8,6 +8,7 @@
 """A configuration test module for unit-tests."""
 import argparse
 import contextlib
+import copy
 import logging
 import os
 import re
@@ -99,6 +100,24 @@ def create_partial_model_schema(is_single=True, num_models=1, with_target_type=F
     return model_schema
 
 
+@pytest.fixture(name="partial_model_schema_factory", scope="class")
+def fixture_partial_model_schema_factory():
+    """
+    A factory fixture to return a partial model schema in a single/multi model form definitions.
+    Every schema form is created once per test class and a deep copy of it is returned.
+    """
+
+    partial_model_schemas = {}
+
+    def _inner(is_single=True, num_models=1, with_target_type=False):
+        schema_form = (is_single, num_models, with_target_type)
+        if schema_form not in partial_model_schemas:
+            partial_model_schemas[schema_form] = create_partial_model_schema(*schema_form)
+        return copy.deepcopy(partial_model_schemas[schema_form])
+
+    return _inner
+
+
 def create_partial_deployment_schema(is_single=True, num_deployments=1):
     """Creates a partial deployment schema in a single/multi form deployment definition."""
 
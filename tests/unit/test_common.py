@@ -6,12 +6,15 @@
 # pylint: disable=too-many-arguments
 
 """A module that contains unit-tests for the common package."""
+import copy
+import pickle
 import re
 
 import pytest
 
 from common.convertors import MemoryConvertor
 from common.exceptions import InvalidMemoryValue
+from common.exceptions import InvalidModelSchema
 from common.exceptions import NamespaceAlreadySet
 from common.exceptions import NamespaceNotInitialized
 from common.git_tool import GitTool
@@ -41,6 +44,32 @@ class TestConvertor:
         assert "The memory value format is invalid" in str(ex)
 
 
+class TestExceptions:
+    """Contains the exceptions unit-tests."""
+
+    @pytest.mark.parametrize(
+        "clone_func",
+        [copy.copy, copy.deepcopy, lambda ex: pickle.loads(pickle.dumps(ex))],
+        ids=["copy", "deepcopy", "pickle"],
+    )
+    def test_code_is_preserved(self, clone_func):
+        """Test that the exception code is preserved when an exception is copied or pickled."""
+
+        exception = InvalidModelSchema("Invalid model schema.", code=5)
+        cloned_exception = clone_func(exception)
+        assert isinstance(cloned_exception, InvalidModelSchema)
+        assert str(cloned_exception) == "Invalid model schema."
+        assert cloned_exception.code == 5
+
+    def test_default_code_is_preserved(self):
+        """Test that the default exception code is preserved when an exception is pickled."""
+
+        exception = InvalidModelSchema("Key error\nMissing key: 'model_id'")
+        unpickled_exception = pickle.loads(pickle.dumps(exception))
+        assert str(unpickled_exception) == "Missing key: 'model_id'"
+        assert unpickled_exception.code == -1
+
+
 class TestGitTool:
     """Contains Git tool unit-tests."""
 
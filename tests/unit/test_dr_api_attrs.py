@@ -8,8 +8,6 @@
 A module to test the mapping between local schema attribute values to their corresponding attribute
 values in DataRobot API.
 """
-from schema import Optional
-
 from dr_api_attrs import DrApiCustomModelChecks
 from dr_api_attrs import DrApiModelSettings
 from dr_api_attrs import DrApiTargetType
@@ -27,24 +25,20 @@ class TestDrApiAttrsMappings:
         A case to test model check attributes correlation between local and DataRobot API.
         """
 
-        local_optional_checks = ModelSchema.MODEL_SCHEMA.schema[Optional(ModelSchema.TEST_KEY)][
-            Optional(ModelSchema.CHECKS_KEY)
-        ]
-        for local_optional_check in local_optional_checks:
-            assert DrApiCustomModelChecks.to_dr_attr(local_optional_check.schema)
+        local_test_section = ModelSchema.MODEL_SCHEMA["properties"][ModelSchema.TEST_KEY]
+        local_optional_checks = local_test_section["properties"][ModelSchema.CHECKS_KEY]
+        for local_optional_check in local_optional_checks["properties"]:
+            assert DrApiCustomModelChecks.to_dr_attr(local_optional_check)
 
     def test_model_settings_mapping(self):
         """
         A case to test model settings attributes correlation between local and DataRobot API.
         """
 
-        local_setting_keys = ModelSchema.MODEL_SCHEMA.schema[ModelSchema.SETTINGS_SECTION_KEY]
-        for local_setting_key in local_setting_keys:
-            if isinstance(local_setting_key, Optional):
-                local_name = local_setting_key.schema
-            else:
-                local_name = local_setting_key
-
+        local_settings_section = ModelSchema.MODEL_SCHEMA["properties"][
+            ModelSchema.SETTINGS_SECTION_KEY
+        ]
+        for local_name in local_settings_section["properties"]:
             remote_key = DrApiModelSettings.to_dr_attr(local_name)
             if remote_key == DrApiModelSettings.ReservedValues.UNSET:
                 remote_key = DrApiModelSettings.STRUCTURED_TRAINING_HOLDOUT_PATCH_MAPPING.get(
@@ -72,6 +66,8 @@ class TestDrApiAttrsMappings:
         A case to test target type attributes correlation between local and DataRobot API.
         """
 
-        local_target_types = ModelSchema.MODEL_SCHEMA.schema[ModelSchema.TARGET_TYPE_KEY].args
+        local_target_types = ModelSchema.MODEL_SCHEMA["properties"][ModelSchema.TARGET_TYPE_KEY][
+            "enum"
+        ]
         for local_target_type in local_target_types:
             assert DrApiTargetType.to_dr_attr(local_target_type)
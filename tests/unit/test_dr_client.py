@@ -18,7 +18,6 @@ from abc import abstractmethod
 import mock
 import pytest
 import responses
-import schema
 from bson import ObjectId
 from mock import Mock
 from mock import patch
@@ -1941,15 +1940,10 @@ class TestModelReplacementPayloadConstruction:
     def test_replacement_reason_success(self, minimal_regression_model_info):
         """Test all valid model replacement values in a model's definition file."""
 
-        model_replacement_values = None
-        schema_version_section = ModelSchema.MODEL_SCHEMA.schema[ModelSchema.VERSION_KEY]
-        for key, value in schema_version_section.items():
-            if (
-                isinstance(key, schema.Optional)
-                and key.schema == ModelSchema.MODEL_REPLACEMENT_REASON_KEY
-            ):
-                model_replacement_values = value.args
-        assert model_replacement_values is not None
+        schema_version_section = ModelSchema.MODEL_SCHEMA["properties"][ModelSchema.VERSION_KEY]
+        model_replacement_values = schema_version_section["properties"][
+            ModelSchema.MODEL_REPLACEMENT_REASON_KEY
+        ]["enum"]
         for replacement_reason in model_replacement_values:
             minimal_regression_model_info.set_value(
                 ModelSchema.VERSION_KEY,
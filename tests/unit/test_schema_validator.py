@@ -3,6 +3,8 @@
 #  This is proprietary source code of DataRobot, Inc. and its affiliates.
 #  Released under the terms of DataRobot Tool and Utility Agreement.
 
+# pylint: disable=too-many-arguments
+
 """A module that contains unit-tests for schema validators."""
 
 import copy
@@ -15,10 +17,13 @@ from bson import ObjectId
 from common.exceptions import InvalidModelSchema
 from common.exceptions import InvalidSchema
 from common.exceptions import UnexpectedType
+from common.namepsace import Namespace
 from schema_validator import DeploymentSchema
 from schema_validator import ModelSchema
 from tests.unit.conftest import create_partial_deployment_schema
-from tests.unit.conftest import create_partial_model_schema
+
+Key = namedtuple("Key", ["type", "name", "value"])
+_GLOB_KEYS = (ModelSchema.INCLUDE_GLOB_KEY, ModelSchema.EXCLUDE_GLOB_KEY)
 
 
 class TestModelSchemaValidator:
@@ -38,28 +43,39 @@ class TestModelSchemaValidator:
             ModelSchema.VERSION_KEY: {ModelSchema.MODEL_ENV_ID_KEY: "627785ea562155d227c6a56c"},
         }
 
-    def test_is_single_models_schema(self):
+    def test_is_single_models_schema(self, partial_model_schema_factory):
         """A case to test whether a given schema is of a single model's schema pattern."""
 
-        single_model_schema = create_partial_model_schema(is_single=True)
+        single_model_schema = partial_model_schema_factory(is_single=True)
         assert ModelSchema.is_single_model_schema(single_model_schema)
         assert not ModelSchema.is_multi_models_schema(single_model_schema)
         assert not DeploymentSchema.is_single_deployment_schema(single_model_schema)
         assert not DeploymentSchema.is_multi_deployments_schema(single_model_schema)
 
-    def test_is_multi_models_schema(self):
+    def test_is_multi_models_schema(self, partial_model_schema_factory):
         """A case to test whether a given schema is of a multi-models' schema pattern."""
 
-        multi_model_schema = create_partial_model_schema(is_single=False, num_models=2)
+        multi_model_schema = partial_model_schema_factory(is_single=False, num_models=2)
         assert ModelSchema.is_multi_models_schema(multi_model_schema)
         assert not ModelSchema.is_single_model_schema(multi_model_schema)
 
+    @pytest.mark.parametrize(
+        "yaml_content",
+        [f"{ModelSchema.MULTI_MODELS_KEY}: none", [ModelSchema.MULTI_MODELS_KEY], 10],
+        ids=["str", "list", "int"],
+    )
+    def test_is_not_model_schema(self, yaml_content):
+        """A case to test that non-dict yaml contents are not detected as a model's schema."""
+
+        assert not ModelSchema.is_single_model_schema(yaml_content)
+        assert not ModelSchema.is_multi_models_schema(yaml_content)
+
     @pytest.mark.parametrize(
         "binary_target_type",
         [ModelSchema.TARGET_TYPE_BINARY, ModelSchema.TARGET_TYPE_UNSTRUCTURED_BINARY],
     )
     @pytest.mark.parametrize("is_single", [True, False], ids=["single", "multi"])
-    def test_for_binary_model(self, binary_target_type, is_single):
+    def test_for_binary_model(self, binary_target_type, is_single, partial_model_schema_factory):
         """A case to test a Binary custom model schema."""
 
         def _set_binary_keys(schema):
@@ -67,10 +83,11 @@ class TestModelSchemaValidator:
             schema[ModelSchema.SETTINGS_SECTION_KEY][ModelSchema.POSITIVE_CLASS_LABEL_KEY] = "1"
             schema[ModelSchema.SETTINGS_SECTION_KEY][ModelSchema.NEGATIVE_CLASS_LABEL_KEY] = "0"
 
-        self._validate_for_model_type(is_single, _set_binary_keys)
+        self._validate_for_model_type(
+            is_single, partial_model_schema_factory(is_single), _set_binary_keys
+        )
 
-    def _validate_for_model_type(self, is_single, setup_model_keys_func):
-        model_schema = create_partial_model_schema(is_single, num_models=1)
+    def _validate_for_model_type(self, is_single, model_schema, setup_model_keys_func):
         with pytest.raises(InvalidSchema):
             # Partial schema should fail
             self._validate_schema(is_single, model_schema)
@@ -89,22 +106,18 @@ class TestModelSchemaValidator:
             transformed_schema = ModelSchema.validate_and_transform_single(model_schema)
 
             # Validate existence of default values
-            for glob_key in [
-                ModelSchema.INCLUDE_GLOB_KEY,
-                ModelSchema.EXCLUDE_GLOB_KEY,
-            ]:
-                assert isinstance(transformed_schema[ModelSchema.VERSION_KEY][glob_key], list)
+            version_section = transformed_schema[ModelSchema.VERSION_KEY]
+            for glob_key in _GLOB_KEYS:
+                assert isinstance(version_section[glob_key], list)
         else:
             transformed_schema = ModelSchema.validate_and_transform_multi(model_schema)
 
             # Validate existence of default values
             for model_entry in transformed_schema[ModelSchema.MULTI_MODELS_KEY]:
-                for glob_key in [
-                    ModelSchema.INCLUDE_GLOB_KEY,
-                    ModelSchema.EXCLUDE_GLOB_KEY,
-                ]:
-                    model_metadata = model_entry[ModelSchema.MODEL_ENTRY_META_KEY]
-                    assert isinstance(model_metadata[ModelSchema.VERSION_KEY][glob_key], list)
+                model_metadata = model_entry[ModelSchema.MODEL_ENTRY_META_KEY]
+                version_section = model_metadata[ModelSchema.VERSION_KEY]
+                for glob_key in _GLOB_KEYS:
+                    assert isinstance(version_section[glob_key], list)
 
     @pytest.mark.parametrize(
         "binary_target_type",
@@ -115,7 +128,9 @@ class TestModelSchemaValidator:
         [ModelSchema.POSITIVE_CLASS_LABEL_KEY, ModelSchema.NEGATIVE_CLASS_LABEL_KEY, None],
     )
     @pytest.mark.parametrize("is_single", [True, False], ids=["single", "multi"])
-    def test_missing_key_for_binary_model(self, binary_target_type, class_label_key, is_single):
+    def test_missing_key_for_binary_model(
+        self, binary_target_type, class_label_key, is_single, partial_model_schema_factory
+    ):
         """A case to test missing key in a Binary model schema."""
 
         def _set_binary_keys(schema):
@@ -124,7 +139,9 @@ class TestModelSchemaValidator:
                 schema[ModelSchema.SETTINGS_SECTION_KEY][class_label_key] = "fake"
 
         with pytest.raises(InvalidModelSchema):
-            self._validate_for_model_type(is_single, _set_binary_keys)
+            self._validate_for_model_type(
+                is_single, partial_model_schema_factory(is_single), _set_binary_keys
+            )
 
     @pytest.mark.parametrize(
         "regression_target_type",
@@ -134,13 +151,17 @@ class TestModelSchemaValidator:
         ],
     )
     @pytest.mark.parametrize("is_single", [True, False], ids=["single", "multi"])
-    def test_for_regression_model(self, regression_target_type, is_single):
+    def test_for_regression_model(
+        self, regression_target_type, is_single, partial_model_schema_factory
+    ):
         """A case to test a Regression model schema."""
 
         def _set_regression_key(schema):
             schema[ModelSchema.TARGET_TYPE_KEY] = regression_target_type
 
-        self._validate_for_model_type(is_single, _set_regression_key)
+        self._validate_for_model_type(
+            is_single, partial_model_schema_factory(is_single), _set_regression_key
+        )
 
     @pytest.mark.parametrize(
         "multiclass_target_type",
@@ -150,40 +171,49 @@ class TestModelSchemaValidator:
         ],
     )
     @pytest.mark.parametrize("is_single", [True, False], ids=["single", "multi"])
-    def test_for_multiclass_model(self, multiclass_target_type, is_single):
+    def test_for_multiclass_model(
+        self, multiclass_target_type, is_single, partial_model_schema_factory
+    ):
         """A case to test a Mult-Class model schema."""
 
         def _set_multiclass_keys(schema):
             schema[ModelSchema.TARGET_TYPE_KEY] = multiclass_target_type
             schema[ModelSchema.SETTINGS_SECTION_KEY][ModelSchema.CLASS_LABELS_KEY] = ["1", "2", "3"]
 
-        self._validate_for_model_type(is_single, _set_multiclass_keys)
+        self._validate_for_model_type(
+            is_single, partial_model_schema_factory(is_single), _set_multiclass_keys
+        )
 
     @pytest.mark.parametrize("is_single", [True, False], ids=["single", "multi"])
-    def test_missing_key_for_multiclass_model(self, is_single):
+    def test_missing_key_for_multiclass_model(self, is_single, partial_model_schema_factory):
         """A case to test a missing key in a Multi-Class model schema."""
 
         def _set_multiclass_keys(schema):
             schema[ModelSchema.TARGET_TYPE_KEY] = ModelSchema.TARGET_TYPE_MULTICLASS
 
         with pytest.raises(InvalidModelSchema):
-            self._validate_for_model_type(is_single, _set_multiclass_keys)
+            self._validate_for_model_type(
+                is_single, partial_model_schema_factory(is_single), _set_multiclass_keys
+            )
 
     @pytest.mark.parametrize("is_single", [True, False], ids=["single", "multi"])
-    def test_for_unstructured_model_type(self, is_single):
+    def test_for_unstructured_model_type(self, is_single, partial_model_schema_factory):
         """A case to test an unstructured model schema."""
 
         def _set_unstructured_keys(schema):
             schema[ModelSchema.TARGET_TYPE_KEY] = ModelSchema.TARGET_TYPE_UNSTRUCTURED_OTHER
 
-        self._validate_for_model_type(is_single, _set_unstructured_keys)
+        self._validate_for_model_type(
+            is_single, partial_model_schema_factory(is_single), _set_unstructured_keys
+        )
 
     @pytest.mark.parametrize("is_single", [True, False], ids=["single", "multi"])
-    def test_invalid_mutual_exclusive_keys_target_types(self, is_single):
+    def test_invalid_mutual_exclusive_keys_target_types(
+        self, is_single, partial_model_schema_factory
+    ):
         """A case to test an invalid mutual exclusive keys related to target types."""
 
-        Key = namedtuple("Key", ["type", "name", "value"])
-        mutual_exclusive_keys = {
+        mutual_exclusive_keys = (
             Key(
                 type=ModelSchema.TARGET_TYPE_REGRESSION,
                 name=ModelSchema.PREDICTION_THRESHOLD_KEY,
@@ -206,23 +236,24 @@ class TestModelSchemaValidator:
                 name=ModelSchema.CLASS_LABELS_KEY,
                 value=("a", "b", "c"),
             ),
-        }
+        )
 
         def _set_single_model_keys(comb, schema):
             if not is_single:
                 schema = schema[ModelSchema.MULTI_MODELS_KEY][0][ModelSchema.MODEL_ENTRY_META_KEY]
+            settings_section = schema[ModelSchema.SETTINGS_SECTION_KEY]
             for element in comb:
                 if isinstance(element, Key):
                     # The 'type' is not really important here
                     schema[ModelSchema.TARGET_TYPE_KEY] = element.type
-                    schema[ModelSchema.SETTINGS_SECTION_KEY][element.name] = element.value
+                    settings_section[element.name] = element.value
                 else:
                     for key in element:
                         # The 'type' is not really important here
                         schema[ModelSchema.TARGET_TYPE_KEY] = key.type
-                        schema[ModelSchema.SETTINGS_SECTION_KEY][key.name] = key.value
+                        settings_section[key.name] = key.value
 
-        model_schema = create_partial_model_schema(is_single, num_models=1)
+        model_schema = partial_model_schema_factory(is_single, num_models=1)
         comb_keys = combinations(mutual_exclusive_keys, 2)
         for comb in comb_keys:
             _set_single_model_keys(comb, model_schema)
@@ -231,13 +262,17 @@ class TestModelSchemaValidator:
 
     @pytest.mark.parametrize("is_single", [True, False], ids=["single", "multi"])
     @pytest.mark.parametrize("section", [ModelSchema.SETTINGS_SECTION_KEY, ModelSchema.VERSION_KEY])
-    def test_invalid_mutual_exclusive_keys_partitioning_and_holdout(self, is_single, section):
+    def test_invalid_mutual_exclusive_keys_partitioning_and_holdout(
+        self, is_single, section, partial_model_schema_factory
+    ):
         """
         A case to test an invalid mutual exclusive keys related to partitioning and holdout
         attributes.
         """
 
-        model_metadata = create_partial_model_schema(is_single, num_models=1, with_target_type=True)
+        model_metadata = partial_model_schema_factory(
+            is_single, num_models=1, with_target_type=True
+        )
 
         edit_metadata = (
             model_metadata
@@ -257,14 +292,16 @@ class TestModelSchemaValidator:
     @pytest.mark.parametrize("is_unstructured", [True, False], ids=["unstructured", "structured"])
     @pytest.mark.parametrize("with_holdout", [True, False], ids=["with-holdout", "without-holdout"])
     def test_invalid_mutual_exclusive_training_and_holdout_keys_between_settings_and_version(
-        self, is_single, is_unstructured, with_holdout
+        self, is_single, is_unstructured, with_holdout, partial_model_schema_factory
     ):
         """
         A case to test an invalid mutual exclusive keys between model settings section and version
         section, related to training and holdout dataset attributes.
         """
 
-        model_metadata = create_partial_model_schema(is_single, num_models=1, with_target_type=True)
+        model_metadata = partial_model_schema_factory(
+            is_single, num_models=1, with_target_type=True
+        )
 
         edit_metadata = (
             model_metadata
@@ -296,8 +333,17 @@ class TestModelSchemaValidator:
 
     @pytest.mark.parametrize("is_single", [True, False], ids=["single", "multi"])
     @pytest.mark.parametrize(
-        "mandatory_key_to_skip",
+        "key, sub_key",
         [
+            (ModelSchema.MODEL_ID_KEY, None),
+            (ModelSchema.TARGET_TYPE_KEY, None),
+            (ModelSchema.VERSION_KEY, None),
+            (ModelSchema.SETTINGS_SECTION_KEY, None),
+            (ModelSchema.SETTINGS_SECTION_KEY, ModelSchema.NAME_KEY),
+            (ModelSchema.SETTINGS_SECTION_KEY, ModelSchema.TARGET_NAME_KEY),
+            (ModelSchema.VERSION_KEY, ModelSchema.MODEL_ENV_ID_KEY),
+        ],
+        ids=[
             ModelSchema.MODEL_ID_KEY,
             ModelSchema.TARGET_TYPE_KEY,
             ModelSchema.VERSION_KEY,
@@ -307,14 +353,9 @@ class TestModelSchemaValidator:
             f"{ModelSchema.VERSION_KEY}.{ModelSchema.MODEL_ENV_ID_KEY}",
         ],
     )
-    def test_missing_mandatory_keys(
-        self, is_single, mandatory_key_to_skip, regression_model_schema
-    ):
+    def test_missing_mandatory_keys(self, is_single, key, sub_key, regression_model_schema):
         """A case to test missing mandatory keys in a schema."""
 
-        key_and_sub_key = mandatory_key_to_skip.split(".")
-        key = key_and_sub_key[0]
-        sub_key = key_and_sub_key[1] if len(key_and_sub_key) == 2 else None
         if sub_key:
             regression_model_schema[key].pop(sub_key)
         else:
@@ -326,7 +367,7 @@ class TestModelSchemaValidator:
         with pytest.raises(InvalidSchema) as ex:
             self._validate_schema(is_single, regression_model_schema)
 
-        assert f"Missing key: '{sub_key or key}'" in str(ex)
+        assert str(ex.value) == f"Missing key: '{sub_key or key}'"
 
     @staticmethod
     def _wrap_multi(model_schema):
@@ -343,12 +384,66 @@ class TestModelSchemaValidator:
     def test_full_model_schema(self, is_single, mock_full_binary_model_schema):
         """A case to test a full model Schema."""
 
-        full_model_schema = mock_full_binary_model_schema.copy()
+        full_model_schema = mock_full_binary_model_schema
         if not is_single:
             full_model_schema = self._wrap_multi(full_model_schema)
 
         self._validate_schema(is_single, full_model_schema)
 
+        # The validation is done on a copy, so the input metadata is expected to remain untouched
+        version_section = mock_full_binary_model_schema[ModelSchema.VERSION_KEY]
+        assert version_section[ModelSchema.MEMORY_KEY] == "100Mi"
+
+    @pytest.mark.parametrize("is_single", [True, False], ids=["single", "multi"])
+    def test_default_values(self, is_single, regression_model_schema):
+        """A case to test that missing optional keys are set with their default values."""
+
+        regression_model_schema[ModelSchema.TEST_KEY] = {
+            ModelSchema.TEST_DATA_ID_KEY: "62779bef562155562769f932"
+        }
+        if is_single:
+            transformed = ModelSchema.validate_and_transform_single(regression_model_schema)
+        else:
+            transformed = ModelSchema.validate_and_transform_multi(
+                self._wrap_multi(regression_model_schema)
+            )
+            transformed = transformed[ModelSchema.MULTI_MODELS_KEY][0][
+                ModelSchema.MODEL_ENTRY_META_KEY
+            ]
+
+        version_section = transformed[ModelSchema.VERSION_KEY]
+        assert version_section[ModelSchema.INCLUDE_GLOB_KEY] == []
+        assert version_section[ModelSchema.EXCLUDE_GLOB_KEY] == []
+        assert (
+            version_section[ModelSchema.MODEL_REPLACEMENT_REASON_KEY]
+            == ModelSchema.MODEL_REPLACEMENT_REASON_OTHER
+        )
+        assert transformed[ModelSchema.TEST_KEY][ModelSchema.TEST_SKIP_KEY] is False
+
+    @pytest.mark.parametrize("is_single", [True, False], ids=["single", "multi"])
+    @pytest.mark.parametrize(
+        "section, key, value",
+        [
+            (ModelSchema.VERSION_KEY, ModelSchema.REPLICAS_KEY, 2.0),
+            (ModelSchema.VERSION_KEY, ModelSchema.MEMORY_KEY, 1024.0),
+            (ModelSchema.TEST_KEY, ModelSchema.MEMORY_KEY, 1024.0),
+        ],
+        ids=["version-replicas", "version-memory", "test-memory"],
+    )
+    def test_float_instead_of_integer(
+        self, is_single, section, key, value, regression_model_schema
+    ):
+        """A case to test that a float value is rejected where an integer is expected."""
+
+        regression_model_schema.setdefault(
+            section, {ModelSchema.TEST_DATA_ID_KEY: "62779bef562155562769f932"}
+        )
+        regression_model_schema[section][key] = value
+        if not is_single:
+            regression_model_schema = self._wrap_multi(regression_model_schema)
+        with pytest.raises(InvalidModelSchema):
+            self._validate_schema(is_single, regression_model_schema)
+
     @pytest.mark.parametrize("is_single", [True, False], ids=["single", "multi"])
     def test_forbidden_extra_fields(self, is_single, regression_model_schema):
         """A case to test forbidden extra fields."""
@@ -361,6 +456,20 @@ class TestModelSchemaValidator:
             self._validate_schema(is_single, regression_model_schema)
         assert f"Wrong key '{forbidden_key}'" in str(ex)
 
+    @pytest.mark.parametrize("is_single", [True, False], ids=["single", "multi"])
+    def test_uninitialized_namespace(self, is_single, regression_model_schema):
+        """A case to test that a missing namespace is reported as an invalid model schema."""
+
+        if not is_single:
+            regression_model_schema = self._wrap_multi(regression_model_schema)
+        origin_namespace = Namespace.namespace()
+        Namespace.uninit()
+        try:
+            with pytest.raises(InvalidModelSchema, match="namespace was not initialized"):
+                self._validate_schema(is_single, regression_model_schema)
+        finally:
+            Namespace.init(origin_namespace)
+
     @pytest.mark.parametrize("is_single", [True, False], ids=["single", "multi"])
     def test_dependent_stability_test_check_keys(self, is_single, regression_model_schema):
         """A case to test dependent keys in a custom model stability test check."""
@@ -500,7 +609,9 @@ class TestModelSchemaSetValue:
             for k, v in ModelSchema.__dict__.items()
             if k.startswith("TARGET_TYPE_") and not k.endswith("_KEY")
         }
-        target_type_choices = set(ModelSchema.MODEL_SCHEMA.schema["target_type"].args)
+        target_type_choices = set(
+            ModelSchema.MODEL_SCHEMA["properties"][ModelSchema.TARGET_TYPE_KEY]["enum"]
+        )
         assert target_type_value_definitions == target_type_choices
 
 